@@ -6,14 +6,34 @@ Preserves config files, dotfiles, and environment files.
 """
 
 import argparse
+import bisect
+import cProfile
 import fnmatch
 import json
 import logging
 import os
+import pstats
+import queue
+import re
 import shutil
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used instead
+    orjson = None
+
+try:
+    import pathspec
+except ImportError:  # optional; gitignore lines are then matched as fnmatch globs
+    pathspec = None
 
 # Configure logging
 logging.basicConfig(
@@ -21,13 +41,181 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Only fan subdirectories out to the thread pool when a directory has more
+# than this many; smaller fan-outs are cheaper to walk inline.
+PARALLEL_MIN_SUBDIRS = 4
+
+# Bytes handed to a single os.sendfile call
+SENDFILE_CHUNK = 8 * 1024 * 1024
+
+# Buffer size for the userspace copy used when sendfile is unavailable
+COPY_BUFSIZE = 1024 * 1024
+
+# File copies allowed to be queued or in flight before the walk waits
+MAX_PENDING_COPIES = 32
+
+# Characters with special meaning in gitignore patterns
+GITIGNORE_SPECIAL = re.compile(r"([\[\]*?\\!#])")
+
+# Number of functions listed by --profile
+PROFILE_TOP_N = 30
+
+
+@contextmanager
+def queued_logging() -> Iterator[None]:
+    """Hand root log records to a background thread instead of writing inline.
+
+    Walker threads only enqueue records; the listener thread does the stream
+    I/O, so a burst of messages never stalls the walk on stderr.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        root.handlers = handlers
+
+
+def fadvise(fd: int, advice: str) -> None:
+    """Best-effort posix_fadvise over a whole file; a no-op where unsupported"""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+
+def copy_file_contents(src: str, dst: str) -> None:
+    """Copy file data in-kernel with os.sendfile, falling back to a buffered copy.
+
+    os.sendfile only supports file-to-file copies on Linux; elsewhere (or on
+    filesystems that refuse it) the first call fails and nothing was written yet.
+    The source is read sequentially once, so readahead is widened up front and
+    both files are dropped from the page cache afterwards rather than evicting
+    other processes' working sets.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        fadvise(infd, "POSIX_FADV_SEQUENTIAL")
+        try:
+            offset = 0
+            try:
+                while True:
+                    sent = os.sendfile(outfd, infd, offset, SENDFILE_CHUNK)
+                    if sent == 0:
+                        return
+                    offset += sent
+            except (AttributeError, OSError):
+                if offset:
+                    raise
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+        finally:
+            fdst.flush()
+            fadvise(infd, "POSIX_FADV_DONTNEED")
+            fadvise(outfd, "POSIX_FADV_DONTNEED")
+
+
+def is_suffix_pattern(pattern: str) -> bool:
+    """True for globs like "*.pyc" that only match a single final extension"""
+    return pattern.startswith("*.") and not any(c in pattern[2:] for c in "*?[.")
+
+
+def compile_patterns(patterns: Iterable[str]) -> Optional[Pattern[str]]:
+    """Compile glob patterns into a single regex union (None if empty)"""
+    translated = [f"(?:{fnmatch.translate(p)})" for p in patterns]
+    if not translated:
+        return None
+    return re.compile("|".join(translated))
+
+
+def root_gitignore_line(line: str, base: str) -> str:
+    r"""Rewrite a .gitignore line from directory base so it matches from the root.
+
+    Lines containing a non-trailing slash are anchored at their .gitignore's
+    directory; all others match at any depth below it. Glob metacharacters in
+    base are escaped so directory names like "a[1]" match literally.
+
+    >>> root_gitignore_line("/f.dat", "a[1]/")
+    '/a\\[1\\]/f.dat'
+    >>> root_gitignore_line("!*.log", "src/")
+    '!/src/**/*.log'
+    """
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    base = GITIGNORE_SPECIAL.sub(r"\\\1", base)
+    if "/" in line.rstrip("/"):
+        line = f"/{base}{line.lstrip('/')}"
+    else:
+        line = f"/{base}**/{line}"
+    return f"!{line}" if negate else line
+
+
+class GitignoreRules:
+    """The .gitignore lines in effect for a directory, compiled for matching.
+
+    With pathspec installed the lines get full gitignore semantics (anchoring,
+    "**", negation, directory patterns); without it they are plain fnmatch globs
+    tested against both the relative path and the file name.
+    """
+
+    def __init__(self, lines: List[str]):
+        self.lines = lines
+        if pathspec is not None:
+            self._spec = pathspec.GitIgnoreSpec.from_lines(lines)
+        else:
+            self._regex = compile_patterns(lines)
+
+    def match_file(self, relative_path: str) -> bool:
+        """Check whether a path relative to the source directory is ignored"""
+        if pathspec is not None:
+            return self._spec.match_file(relative_path)
+        return bool(
+            self._regex
+            and (
+                self._regex.match(relative_path)
+                or self._regex.match(os.path.basename(relative_path))
+            )
+        )
+
 
 class MigrationPrep:
-    def __init__(self, source_dir: str, backup_dir: str):
+    def __init__(
+        self,
+        source_dir: str,
+        backup_dir: str,
+        workers: Optional[int] = None,
+        dry_run: bool = False,
+    ):
         self.source_dir = Path(source_dir).expanduser().resolve()
         self.backup_dir = Path(backup_dir).expanduser().resolve()
+        self.workers = workers or (os.cpu_count() or 1) * 2
+        # Dry runs walk and filter everything but never touch the destination
+        self.dry_run = dry_run
         self.stats = {"copied": 0, "skipped": 0, "errors": 0, "size_copied": 0}
 
+        # Walker threads share the stats counters and the pending-futures list
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        # Set when run_backup is unwinding (e.g. Ctrl-C) so walkers stop early
+        self._stop = threading.Event()
+
+        # Copies run on their own pool so the walk keeps filtering meanwhile
+        self._copy_executor: Optional[ThreadPoolExecutor] = None
+        self._copy_slots = threading.BoundedSemaphore(MAX_PENDING_COPIES)
+
+        # (st_dev, st_ino) of every directory entered, to break filesystem loops
+        self._visited_dirs: Set[Tuple[int, int]] = set()
+
+        # Compiled gitignore rules in effect per directory, inherited downwards
+        self._gitignore_cache: Dict[str, Optional[GitignoreRules]] = {}
+
         # Common build/cache directories to skip
         self.skip_dirs = {
             "__pycache__",
@@ -201,128 +389,346 @@ class MigrationPrep:
             ".spacemacs.d",
         }
 
-    def load_gitignore_patterns(self, directory: Path) -> Set[str]:
-        """Load patterns from .gitignore files"""
-        patterns = set()
-        gitignore_file = directory / ".gitignore"
+        # Frozen for cheap membership tests during the walk
+        self.skip_dirs = frozenset(self.skip_dirs)
+
+        # keep_dotfiles are matched both by directory name and as a prefix of
+        # the relative path; the prefixes are sorted for binary search
+        self._keep_dotfile_names = frozenset(
+            name for name in self.keep_dotfiles if "/" not in name
+        )
+        self._keep_dotfile_prefixes = tuple(sorted(self.keep_dotfiles))
+
+        # Plain single-extension skip patterns ("*.pyc") become a suffix set;
+        # only the remaining skip patterns need the regex
+        self._skip_suffixes = frozenset(
+            pattern[1:] for pattern in self.skip_patterns if is_suffix_pattern(pattern)
+        )
+
+        # Each pattern category compiled once into a single regex
+        self._keep_re = compile_patterns(self.keep_patterns)
+        self._skip_re = compile_patterns(
+            p for p in self.skip_patterns if not is_suffix_pattern(p)
+        )
+
+        # Skip-unless-kept verdict for file names as a single regex: the skip
+        # lookahead runs first, so names no skip pattern matches never reach
+        # the keep alternatives
+        self._skip_file_re = self._skip_re
+        if self._skip_re and self._keep_re:
+            self._skip_file_re = re.compile(
+                f"(?=(?:{self._skip_re.pattern}))(?!(?:{self._keep_re.pattern}))"
+            )
+
+    def load_gitignore_patterns(self, directory: str) -> List[str]:
+        """Load patterns from a directory's .gitignore file, in file order"""
+        patterns = []
+        gitignore_file = os.path.join(directory, ".gitignore")
 
-        if gitignore_file.exists():
+        if os.path.exists(gitignore_file):
             try:
                 with open(gitignore_file, "r", encoding="utf-8") as f:
                     for line in f:
                         line = line.strip()
                         if line and not line.startswith("#"):
-                            patterns.add(line)
+                            patterns.append(line)
             except Exception as e:
                 logger.warning(f"Could not read .gitignore from {directory}: {e}")
 
         return patterns
 
-    def should_skip_file(self, file_path: Path, gitignore_patterns: Set[str]) -> bool:
-        """Determine if a file should be skipped"""
-        filename = file_path.name
-        relative_path = str(file_path.relative_to(self.source_dir))
-
-        # Check if it's an important file to keep
-        for pattern in self.keep_patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return False
+    def gitignore_for(
+        self, directory: str, rel_dir: str = ""
+    ) -> Optional[GitignoreRules]:
+        """Gitignore rules for a directory: its parent's lines followed by its own.
+
+        rel_dir is the directory's path relative to the source directory, with
+        a trailing slash ("" for the source directory itself). The walk is
+        top-down, so the parent's entry is always cached first. Directories
+        without a .gitignore share their parent's compiled rules.
+        """
+        if directory in self._gitignore_cache:
+            return self._gitignore_cache[directory]
+
+        parent = self._gitignore_cache.get(os.path.dirname(directory))
+        own = self.load_gitignore_patterns(directory)
+        if not own:
+            rules = parent
+        else:
+            if pathspec is not None:
+                own = [root_gitignore_line(line, rel_dir) for line in own]
+            rules = GitignoreRules((parent.lines if parent else []) + own)
+
+        self._gitignore_cache[directory] = rules
+        return rules
+
+    def should_skip_file(
+        self, filename: str, relative_path: str, gitignore: Optional[GitignoreRules]
+    ) -> bool:
+        """Determine if a file should be skipped.
+
+        A file is skipped when any skip rule matches and no keep pattern does.
+        The skip rules are tried cheapest first (suffix set, skip regex, then
+        gitignore), and keep patterns are only consulted once one has matched;
+        for the skip regex both happen in one match of _skip_file_re.
+        """
+        # Check skip patterns
+        dot = filename.rfind(".")
+        if dot >= 0 and filename[dot:] in self._skip_suffixes:
+            return not self._is_kept(filename)
+        if self._skip_file_re and self._skip_file_re.match(filename):
+            return True
 
         # Check gitignore patterns
-        for pattern in gitignore_patterns:
-            if fnmatch.fnmatch(relative_path, pattern) or fnmatch.fnmatch(
-                filename, pattern
-            ):
-                return True
-
-        # Check skip patterns
-        for pattern in self.skip_patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
+        if gitignore and gitignore.match_file(relative_path):
+            return not self._is_kept(filename)
 
         return False
 
-    def should_skip_directory(self, dir_path: Path) -> bool:
-        """Determine if a directory should be skipped"""
-        dirname = dir_path.name
+    def _is_kept(self, filename: str) -> bool:
+        """Important files are kept even when a skip rule matched"""
+        return bool(self._keep_re and self._keep_re.match(filename))
 
+    def should_skip_directory(self, dirname: str, relative_path: str) -> bool:
+        """Determine if a directory should be skipped"""
         # Always keep important dotfiles/directories
-        relative_path = str(dir_path.relative_to(self.source_dir))
-        for keep_pattern in self.keep_dotfiles:
-            if relative_path.startswith(keep_pattern) or dirname == keep_pattern:
-                return False
+        if dirname in self._keep_dotfile_names:
+            return False
+        if self._has_keep_dotfile_prefix(relative_path):
+            return False
 
         # Skip common build/cache directories
         if dirname in self.skip_dirs:
             return True
 
         # Skip directories matching skip patterns
-        for pattern in self.skip_patterns:
-            if fnmatch.fnmatch(dirname, pattern):
-                return True
+        return self._matches_skip_pattern(dirname)
 
+    def _matches_skip_pattern(self, name: str) -> bool:
+        """Match a name against skip_patterns, trying the suffix set first"""
+        dot = name.rfind(".")
+        if dot >= 0 and name[dot:] in self._skip_suffixes:
+            return True
+        return bool(self._skip_re and self._skip_re.match(name))
+
+    def _has_keep_dotfile_prefix(self, relative_path: str) -> bool:
+        """Check whether any keep_dotfiles entry is a prefix of relative_path.
+
+        Every prefix of a string sorts at or before it, so only entries up to
+        the bisection point can match. If the nearest candidate is not a
+        prefix, any earlier match must also prefix the common part of the
+        candidate and the path, so the search narrows to that and repeats.
+        """
+        prefixes = self._keep_dotfile_prefixes
+        hi = bisect.bisect_right(prefixes, relative_path)
+        while hi:
+            candidate = prefixes[hi - 1]
+            if relative_path.startswith(candidate):
+                return True
+            relative_path = os.path.commonprefix([candidate, relative_path])
+            hi = bisect.bisect_right(prefixes, relative_path, 0, hi - 1)
         return False
 
-    def copy_file_safely(self, src: Path, dst: Path) -> bool:
-        """Copy a file with error handling"""
+    def copy_file_safely(self, src: str, dst: str, size: Optional[int] = None) -> bool:
+        """Copy a file with error handling.
+
+        Pass size when it is already known (e.g. from DirEntry.stat()) to avoid
+        statting the source again.
+        """
+        if self.dry_run:
+            if size is None:
+                size = os.stat(src).st_size
+            logger.debug(f"Would copy {src} to {dst}")
+            with self._lock:
+                self.stats["copied"] += 1
+                self.stats["size_copied"] += size
+            return True
+
         try:
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
-            self.stats["copied"] += 1
-            self.stats["size_copied"] += src.stat().st_size
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            copy_file_contents(src, dst)
+            shutil.copystat(src, dst)
+            if size is None:
+                size = os.stat(src).st_size
+            with self._lock:
+                self.stats["copied"] += 1
+                self.stats["size_copied"] += size
             return True
         except Exception as e:
             logger.error(f"Failed to copy {src} to {dst}: {e}")
-            self.stats["errors"] += 1
+            self._count("errors")
             return False
 
-    def backup_directory(self, src_dir: Path, dst_dir: Path, level: int = 0) -> None:
-        """Recursively backup a directory"""
-        if level > 10:  # Prevent infinite recursion
-            logger.warning(f"Maximum recursion depth reached for {src_dir}")
+    def _count(self, key: str, amount: int = 1) -> None:
+        """Increment a stats counter; safe to call from walker threads"""
+        with self._lock:
+            self.stats[key] += amount
+
+    def _submit(self, fn, *args) -> None:
+        """Schedule walk work on the thread pool and track it for run_backup"""
+        future = self._executor.submit(fn, *args)
+        with self._lock:
+            self._pending.append(future)
+
+    def _dispatch_copy(self, src: str, dst: str, size: int) -> None:
+        """Copy a file on the copy pool, or inline when there is none.
+
+        Blocks while MAX_PENDING_COPIES copies are outstanding, so a fast walk
+        cannot queue up an unbounded backlog. Copy futures are not tracked
+        (copy_file_safely handles its own errors); run_backup drains them by
+        shutting the copy pool down once the walk is done.
+        """
+        if self._copy_executor is None:
+            self.copy_file_safely(src, dst, size)
+            return
+
+        if self._stop.is_set():
             return
+        self._copy_slots.acquire()
+        try:
+            future = self._copy_executor.submit(self.copy_file_safely, src, dst, size)
+        except BaseException:
+            self._copy_slots.release()
+            raise
+        future.add_done_callback(lambda _: self._copy_slots.release())
+
+    def _wait_pending(self) -> None:
+        """Wait for all scheduled work, including work scheduled meanwhile"""
+        while True:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return
+            for future in pending:
+                future.result()
+
+    def backup_directory(self, src_dir: str, dst_dir: str, rel_dir: str = "") -> None:
+        """Walk a directory tree top-down, pruning skipped directories before descent.
+
+        The walk is iterative; wide directories are fanned out to the thread pool.
+        Paths stay plain strings throughout; no Path objects are built per entry.
+        rel_dir is src_dir relative to the source directory with a trailing slash;
+        entry relative paths are built from it by concatenation.
+        """
+        stack = [(src_dir, dst_dir, rel_dir)]
+        while stack and not self._stop.is_set():
+            src_dir, dst_dir, rel_dir = stack.pop()
+            dirs = self._scan_directory(src_dir, dst_dir, rel_dir)
+
+            # Prune skipped directories in place before any of them is entered
+            dirs[:] = [entry for entry in dirs if self._descend_into(entry, rel_dir)]
+
+            children = [
+                (
+                    entry.path,
+                    os.path.join(dst_dir, entry.name),
+                    f"{rel_dir}{entry.name}/",
+                )
+                for entry in dirs
+            ]
+            if self._executor is not None and len(children) > PARALLEL_MIN_SUBDIRS:
+                for child in children:
+                    self._submit(self.backup_directory, *child)
+            else:
+                stack.extend(reversed(children))
+
+    def _descend_into(self, entry: os.DirEntry, rel_dir: str) -> bool:
+        """Decide whether the walk enters a directory, counting it if pruned"""
+        if self.should_skip_directory(entry.name, rel_dir + entry.name):
+            logger.debug(f"Skipping directory: {entry.path}")
+            self._count("skipped")
+            return False
 
         try:
-            gitignore_patterns = self.load_gitignore_patterns(src_dir)
-
-            for item in src_dir.iterdir():
-                try:
-                    if item.is_symlink():
-                        # Handle symlinks carefully
-                        if item.exists():
-                            target_path = dst_dir / item.name
-                            if item.is_file():
-                                if not self.should_skip_file(item, gitignore_patterns):
-                                    self.copy_file_safely(item, target_path)
-                                else:
-                                    self.stats["skipped"] += 1
-                        continue
-
-                    if item.is_file():
-                        if not self.should_skip_file(item, gitignore_patterns):
-                            target_path = dst_dir / item.name
-                            self.copy_file_safely(item, target_path)
-                        else:
-                            self.stats["skipped"] += 1
-
-                    elif item.is_dir():
-                        if not self.should_skip_directory(item):
-                            target_dir = dst_dir / item.name
-                            self.backup_directory(item, target_dir, level + 1)
-                        else:
-                            logger.info(f"Skipping directory: {item}")
-                            self.stats["skipped"] += 1
-
-                except PermissionError:
-                    logger.warning(f"Permission denied: {item}")
-                    self.stats["errors"] += 1
-                except Exception as e:
-                    logger.error(f"Error processing {item}: {e}")
-                    self.stats["errors"] += 1
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            # Let the scan of the directory itself report the error
+            return True
+        if not self._mark_visited(st):
+            logger.debug(f"Skipping already visited directory: {entry.path}")
+            self._count("skipped")
+            return False
+        return True
+
+    def _mark_visited(self, st: os.stat_result) -> bool:
+        """Record a directory as entered; False if it was entered before"""
+        key = (st.st_dev, st.st_ino)
+        with self._lock:
+            if key in self._visited_dirs:
+                return False
+            self._visited_dirs.add(key)
+        return True
+
+    def _scan_directory(
+        self, src_dir: str, dst_dir: str, rel_dir: str
+    ) -> List[os.DirEntry]:
+        """Backup the files of one directory and return its subdirectory entries"""
+        dirs: List[os.DirEntry] = []
+        try:
+            gitignore = self.gitignore_for(src_dir, rel_dir)
+
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    if self._stop.is_set():
+                        break
+                    try:
+                        if self._backup_entry(entry, dst_dir, rel_dir, gitignore):
+                            dirs.append(entry)
+                    except PermissionError:
+                        logger.warning(f"Permission denied: {entry.path}")
+                        self._count("errors")
+                    except Exception as e:
+                        logger.error(f"Error processing {entry.path}: {e}")
+                        self._count("errors")
 
         except Exception as e:
             logger.error(f"Error scanning directory {src_dir}: {e}")
-            self.stats["errors"] += 1
+            self._count("errors")
+
+        return dirs
+
+    def _backup_entry(
+        self,
+        entry: os.DirEntry,
+        dst_dir: str,
+        rel_dir: str,
+        gitignore: Optional[GitignoreRules],
+    ) -> bool:
+        """Backup a single directory entry, using the type info cached by scandir.
+
+        Files are filtered and copied; returns True if the entry is a directory.
+        Types are tested most common first, so a regular file costs one d_type
+        check. Where d_type is unknown, the first test lstats the entry and
+        DirEntry caches the result for the others.
+        """
+        if entry.is_file(follow_symlinks=False):
+            self._backup_file(entry, dst_dir, rel_dir, gitignore)
+            return False
+
+        if entry.is_dir(follow_symlinks=False):
+            return True
+
+        # Handle symlinks carefully: only follow links to existing files
+        if entry.is_symlink() and entry.is_file():
+            self._backup_file(entry, dst_dir, rel_dir, gitignore)
+
+        return False
+
+    def _backup_file(
+        self,
+        entry: os.DirEntry,
+        dst_dir: str,
+        rel_dir: str,
+        gitignore: Optional[GitignoreRules],
+    ) -> None:
+        """Filter a file entry and copy it unless it should be skipped"""
+        name = entry.name
+        if self.should_skip_file(name, rel_dir + name, gitignore):
+            self._count("skipped")
+        else:
+            self._dispatch_copy(
+                entry.path, os.path.join(dst_dir, name), entry.stat().st_size
+            )
 
     def create_backup_info(self) -> None:
         """Create a backup info file with metadata"""
@@ -336,8 +742,11 @@ class MigrationPrep:
 
         info_file = self.backup_dir / "backup_info.json"
         try:
-            with open(info_file, "w") as f:
-                json.dump(info, f, indent=2)
+            if orjson is not None:
+                info_file.write_bytes(orjson.dumps(info, option=orjson.OPT_INDENT_2))
+            else:
+                with open(info_file, "w") as f:
+                    json.dump(info, f, indent=2)
         except Exception as e:
             logger.error(f"Could not create backup info file: {e}")
 
@@ -351,29 +760,57 @@ class MigrationPrep:
             raise ValueError(f"Source directory does not exist: {self.source_dir}")
 
         # Create backup directory
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        if not self.dry_run:
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+
+        # Never descend into the source root again, nor into the backup
+        # itself when it lives inside the source tree
+        self._visited_dirs.clear()
+        self._mark_visited(self.source_dir.stat())
+        if self.backup_dir.exists():
+            self._mark_visited(self.backup_dir.stat())
 
         # Start backup
         start_time = datetime.now()
-        self.backup_directory(self.source_dir, self.backup_dir)
+        self._stop.clear()
+        if self.workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            if not self.dry_run:
+                self._copy_executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            self.backup_directory(str(self.source_dir), str(self.backup_dir))
+            self._wait_pending()
+            # No walker can dispatch more copies now; let the queued ones finish
+            if self._copy_executor is not None:
+                self._copy_executor.shutdown(wait=True)
+        finally:
+            # Running walkers only notice cancellation through this event;
+            # shutdown() alone would wait for their whole subtrees
+            self._stop.set()
+            for executor in (self._executor, self._copy_executor):
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+            self._executor = self._copy_executor = None
         end_time = datetime.now()
 
         # Create backup info
-        self.create_backup_info()
+        if not self.dry_run:
+            self.create_backup_info()
 
         # Print summary
         duration = end_time - start_time
         size_mb = self.stats["size_copied"] / (1024 * 1024)
 
         logger.info("=" * 50)
-        logger.info("BACKUP SUMMARY")
+        logger.info("DRY RUN SUMMARY" if self.dry_run else "BACKUP SUMMARY")
         logger.info("=" * 50)
         logger.info(f"Files copied: {self.stats['copied']}")
         logger.info(f"Files skipped: {self.stats['skipped']}")
         logger.info(f"Errors: {self.stats['errors']}")
         logger.info(f"Size copied: {size_mb:.2f} MB")
         logger.info(f"Duration: {duration}")
-        logger.info(f"Backup location: {self.backup_dir}")
+        if not self.dry_run:
+            logger.info(f"Backup location: {self.backup_dir}")
 
 
 def main():
@@ -386,30 +823,56 @@ def main():
         help="Show what would be copied without copying",
     )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=None,
+        help="Number of walker threads (default: 2x CPU count, 1 disables threading)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print cProfile stats for the walk (implies --workers 1 unless given)",
+    )
 
     args = parser.parse_args()
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    try:
-        if args.dry_run:
-            logger.info("DRY RUN MODE - No files will be copied")
+    with queued_logging():
+        try:
+            if args.dry_run:
+                logger.info("DRY RUN MODE - No files will be copied")
 
-        backup = MigrationPrep(args.source, args.destination)
+            workers = args.workers
+            if args.profile and workers is None:
+                # cProfile only sees the calling thread, so profile a serial walk
+                workers = 1
 
-        if not args.dry_run:
-            backup.run_backup()
-        else:
-            logger.info(
-                "Dry run completed - use without --dry-run to perform actual backup"
+            backup = MigrationPrep(
+                args.source, args.destination, workers=workers, dry_run=args.dry_run
             )
 
-    except KeyboardInterrupt:
-        logger.info("Backup interrupted by user")
-    except Exception as e:
-        logger.error(f"Backup failed: {e}")
-        return 1
+            if args.profile:
+                profiler = cProfile.Profile()
+                profiler.runcall(backup.run_backup)
+                stats = pstats.Stats(profiler, stream=sys.stderr)
+                stats.sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+            else:
+                backup.run_backup()
+
+            if args.dry_run:
+                logger.info(
+                    "Dry run completed - use without --dry-run to perform actual backup"
+                )
+
+        except KeyboardInterrupt:
+            logger.info("Backup interrupted by user")
+        except Exception as e:
+            logger.error(f"Backup failed: {e}")
+            return 1
 
     return 0
 